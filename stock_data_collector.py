@@ -1,9 +1,16 @@
+import asyncio
+import functools
 import logging
-import yfinance as yf
+import logging.handlers
+import queue
+import orjson
+import numpy as np
 import pandas as pd
-import json
 import streamlit as st
-import altair as alt
+
+# yfinance, httpx and altair are imported lazily inside the functions that
+# use them: Streamlit re-executes this script on every rerun, and none of
+# them is needed until the user actually fetches or charts data
 
 # Constants
 DURATIONS_DAYS = {"1D": 1, "5D": 5, "1W": 7, "1M": 30, "YTD": 365, "1Y": 365, "3Y": 1095, "Max": float('inf')}
@@ -15,65 +22,245 @@ MARKET_SUFFIXES = {
     "NASDAQ": "",
     # Add more market codes and their corresponding suffixes
 }
+_VALID_MARKETS = frozenset(MARKET_SUFFIXES)
+PRICE_COLUMNS = ["Open", "High", "Low", "Close", "Adj Close"]
 LOG_FILE = 'stock_data_collector.log'
+YAHOO_CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart/{symbol}?range=max&interval=1d"
 
 # Setup logging
-logging.basicConfig(filename=LOG_FILE, level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+def _setup_logging():
+    """
+    Routes log records through an in-memory queue drained to the log file
+    by a background thread, so logging under the fetch paths never blocks
+    on disk I/O. Streamlit re-executes this script on every rerun, so the
+    handler is only installed once per process.
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return
+    log_queue = queue.Queue(-1)
+    file_handler = logging.FileHandler(LOG_FILE)
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    listener = logging.handlers.QueueListener(log_queue, file_handler)
+    listener.start()
+    root.setLevel(logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+_setup_logging()
 logger = logging.getLogger(__name__)
 
 class InvalidInputError(Exception):
     """Exception raised for errors in the input."""
     pass
 
+@functools.lru_cache(maxsize=128)
+def _compose_symbol(ticker, market):
+    """Returns the fully suffixed Yahoo symbol for a (ticker, market) pair."""
+    return f"{ticker}{MARKET_SUFFIXES[market]}"
+
+def _compact_dtypes(data):
+    """
+    Downcasts the price columns to float32, halving the memory held per
+    ticker; prices are only ever displayed to two decimals. Volume is left
+    untouched so period totals stay exact. The frame is then converted to
+    pyarrow-backed dtypes so downstream slicing and aggregation dispatch
+    to Arrow's multithreaded C++ kernels over zero-copy buffers.
+
+    Args:
+    data (DataFrame): Stock data as returned by a fetch.
+
+    Returns:
+    DataFrame: The same data with compacted, Arrow-backed columns.
+    """
+    price_columns = [col for col in PRICE_COLUMNS if col in data.columns]
+    data[price_columns] = data[price_columns].astype(np.float32)
+    return data.convert_dtypes(dtype_backend='pyarrow')
+
+@st.cache_data(ttl=3600, show_spinner=False)
 def get_stock_data(ticker, market):
     """
     Fetches stock data from Yahoo Finance for a given ticker and market.
-    
+    Results are cached for an hour so repeated fetches for the same
+    (ticker, market) pair are served from memory instead of the network.
+
     Args:
     ticker (str): Stock ticker symbol.
     market (str): Market code.
-    
+
     Returns:
     DataFrame: Stock data as a pandas DataFrame.
-    
+
     Raises:
     InvalidInputError: If no data is found for the ticker.
     """
+    import yfinance as yf
+
     try:
-        if market not in MARKET_SUFFIXES:
+        if market not in _VALID_MARKETS:
             raise InvalidInputError(f"Invalid market selected: {market}")
         
-        yahoo_ticker = f"{ticker}{MARKET_SUFFIXES[market]}"
+        yahoo_ticker = _compose_symbol(ticker, market)
         stock_data = yf.download(yahoo_ticker, period="max")
         
         if stock_data.empty:
             raise InvalidInputError(f"No data found for ticker: {ticker} in market: {market}")
-        
-        return stock_data
+
+        return _compact_dtypes(stock_data)
+    except Exception as e:
+        logger.error(f"Error occurred while fetching stock data from Yahoo Finance: {str(e)}")
+        raise
+
+async def _fetch_chart(client, symbol):
+    """
+    Fetches one symbol's full history from the Yahoo chart API and parses
+    it into a DataFrame shaped like yf.download output.
+
+    Args:
+    client (httpx.AsyncClient): Shared HTTP client.
+    symbol (str): Fully suffixed Yahoo ticker symbol.
+
+    Returns:
+    DataFrame: Stock data indexed by date.
+    """
+    response = await client.get(YAHOO_CHART_URL.format(symbol=symbol))
+    response.raise_for_status()
+    result = orjson.loads(response.content)["chart"]["result"][0]
+    quote = result["indicators"]["quote"][0]
+    frame = pd.DataFrame({
+        "Open": quote["open"],
+        "High": quote["high"],
+        "Low": quote["low"],
+        "Close": quote["close"],
+        "Adj Close": result["indicators"]["adjclose"][0]["adjclose"],
+        "Volume": quote["volume"],
+    }, index=pd.to_datetime(result["timestamp"], unit='s').normalize())
+    frame.index.name = "Date"
+    return frame.dropna(how='all')
+
+async def _fetch_charts(symbols):
+    """
+    Fetches all symbols concurrently over a single HTTP/2 client, so the
+    per-ticker handshake and response waits overlap instead of adding up.
+
+    Args:
+    symbols (list): Fully suffixed Yahoo ticker symbols.
+
+    Returns:
+    list: One DataFrame per symbol, in input order.
+    """
+    import httpx
+
+    async with httpx.AsyncClient(http2=True, timeout=30,
+                                 headers={"User-Agent": "Mozilla/5.0"}) as client:
+        return await asyncio.gather(*[_fetch_chart(client, symbol) for symbol in symbols])
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_stock_data_batch(tickers, market):
+    """
+    Fetches stock data for several tickers from Yahoo Finance, overlapping
+    the per-symbol requests over one async HTTP/2 client and falling back
+    to a batched, threaded yf.download if the direct chart API fails. The
+    whole batch is cached as one entry.
+
+    Args:
+    tickers (tuple): Stock ticker symbols.
+    market (str): Market code.
+
+    Returns:
+    dict: Mapping of ticker symbol to its stock data DataFrame.
+
+    Raises:
+    InvalidInputError: If no data is found for any of the tickers.
+    """
+    try:
+        if market not in _VALID_MARKETS:
+            raise InvalidInputError(f"Invalid market selected: {market}")
+
+        yahoo_tickers = [_compose_symbol(ticker, market) for ticker in tickers]
+
+        try:
+            frames = asyncio.run(_fetch_charts(yahoo_tickers))
+            result = {}
+            for ticker, frame in zip(tickers, frames):
+                if frame.empty:
+                    raise InvalidInputError(f"No data found for ticker: {ticker} in market: {market}")
+                result[ticker] = _compact_dtypes(frame)
+            return result
+        except InvalidInputError:
+            raise
+        except Exception as e:
+            logger.warning(f"Direct chart API fetch failed, falling back to yfinance: {str(e)}")
+
+        import yfinance as yf
+
+        batch = yf.download(" ".join(yahoo_tickers), period="max",
+                            threads=True, group_by='ticker', progress=False)
+
+        if batch.empty:
+            raise InvalidInputError(f"No data found for tickers: {', '.join(tickers)} in market: {market}")
+
+        result = {}
+        for ticker, yahoo_ticker in zip(tickers, yahoo_tickers):
+            stock_data = batch[yahoo_ticker].dropna(how='all') if len(tickers) > 1 else batch
+            if stock_data.empty:
+                raise InvalidInputError(f"No data found for ticker: {ticker} in market: {market}")
+            result[ticker] = _compact_dtypes(stock_data)
+        return result
     except Exception as e:
         logger.error(f"Error occurred while fetching stock data from Yahoo Finance: {str(e)}")
         raise
 
 def save_data_to_json(data, ticker):
     """
-    Saves stock data to a JSON file for a given ticker.
-    
+    Saves stock data to a JSON file for a given ticker. The file uses
+    pandas' "split" orientation (column names, an index of epoch
+    nanoseconds, and a row-major data array) and is written via orjson,
+    which serializes the underlying NumPy buffers directly instead of
+    building a Python dict per row.
+
     Args:
     data (DataFrame): Stock data.
     ticker (str): Stock ticker symbol.
     """
     try:
-        json_data = data.to_json(orient='records')
-        with open(f"{ticker}_data.json", 'w') as file:
-            file.write(json_data)
+        # orjson needs a C-contiguous native-dtype array; to_numpy() on the
+        # Arrow-backed frame yields object dtype, and even with an explicit
+        # dtype the result is column-major
+        payload = {
+            'columns': list(data.columns),
+            'index': data.index.astype('int64').to_numpy(),
+            'data': np.ascontiguousarray(data.to_numpy(dtype='float64')),
+        }
+        with open(f"{ticker}_data.json", 'wb') as file:
+            file.write(orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY))
         logger.info(f"Stock data saved successfully for ticker: {ticker}")
     except Exception as e:
         logger.error(f"Error occurred while saving data to JSON: {str(e)}")
         raise
 
+def save_data_to_parquet(data, ticker):
+    """
+    Saves stock data to a Parquet file for a given ticker. Parquet's
+    columnar, compressed layout writes a fraction of the bytes of the JSON
+    export and lets readers load only the columns they need.
+
+    Args:
+    data (DataFrame): Stock data.
+    ticker (str): Stock ticker symbol.
+    """
+    try:
+        data.to_parquet(f"{ticker}_data.parquet", engine='pyarrow',
+                        compression='zstd', compression_level=3)
+        logger.info(f"Stock data saved successfully for ticker: {ticker}")
+    except Exception as e:
+        logger.error(f"Error occurred while saving data to Parquet: {str(e)}")
+        raise
+
+@st.cache_data(show_spinner=False)
 def filter_data_by_duration(data, duration):
     """
-    Filters data by the specified duration.
+    Filters data by the specified duration. Cached so switching back to a
+    previously viewed duration does not re-slice the data.
     
     Args:
     data (DataFrame): Stock data.
@@ -83,30 +270,119 @@ def filter_data_by_duration(data, duration):
     DataFrame: Filtered data.
     """
     if duration == "YTD":
-        start_date = pd.to_datetime(data.index[0]).strftime("%Y-01-01")
-        filtered_data = data[start_date:]
+        start = pd.Timestamp(data.index[-1].year, 1, 1)
+        filtered_data = data.iloc[data.index.searchsorted(start):]
     elif duration == "Max":
         filtered_data = data
     else:
-        filtered_data = data.tail(DURATIONS_DAYS[duration])
+        cutoff = data.index[-1] - pd.Timedelta(days=DURATIONS_DAYS[duration])
+        filtered_data = data.iloc[data.index.searchsorted(cutoff):]
     return filtered_data
 
-def create_chart(data):
+def _lttb(x, y, n_out):
     """
-    Creates a line chart for the stock data using Altair.
-    
+    Largest-Triangle-Three-Buckets downsampling. From each bucket, keeps
+    the point forming the largest triangle with the previously kept point
+    and the next bucket's average, preserving the visual shape of the
+    series far better than stride sampling.
+
     Args:
-    data (DataFrame): Stock data.
-    
+    x (ndarray): X values, monotonically increasing.
+    y (ndarray): Y values.
+    n_out (int): Number of points to keep.
+
+    Returns:
+    ndarray: Sorted indices of the selected rows.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+    bounds = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = bounds[i], bounds[i + 1]
+        if i < n_out - 3:
+            avg_x = x[hi:bounds[i + 2]].mean()
+            avg_y = y[hi:bounds[i + 2]].mean()
+        else:
+            avg_x, avg_y = x[n - 1], y[n - 1]
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(area.argmax())
+        indices[i + 1] = a
+    return indices
+
+_BOUNDS_CACHE = {}
+
+def _close_bounds(data, ticker, duration):
+    """
+    Returns the (min, max) of the Close column, memoized per
+    (ticker, duration, len(data), last index entry) so repeated duration
+    clicks do not rescan the full history; the length and end date bust
+    stale entries after a refetch.
+
+    Args:
+    data (DataFrame): Filtered stock data.
+    ticker (str): Stock ticker symbol.
+    duration (str): Selected duration.
+
+    Returns:
+    tuple: Minimum and maximum closing price.
+    """
+    key = (ticker, duration, len(data), data.index[-1])
+    bounds = _BOUNDS_CACHE.get(key)
+    if bounds is None:
+        if len(_BOUNDS_CACHE) >= 16:
+            _BOUNDS_CACHE.clear()
+        close = data["Close"].to_numpy()
+        bounds = (close.min(), close.max())
+        _BOUNDS_CACHE[key] = bounds
+    return bounds
+
+@st.cache_resource(max_entries=8, ttl=3600)
+def create_chart(_data, ticker, duration, length, end_date):
+    """
+    Creates a line chart for the stock data using Altair. The chart object
+    is cached per (ticker, duration, length, end_date) so repeat renders
+    at the same duration skip the spec rebuild; the underscore on _data
+    tells Streamlit not to hash the DataFrame itself, and length/end_date
+    stand in for it so a refetch with updated history misses the cache
+    instead of serving the stale chart.
+
+    Args:
+    _data (DataFrame): Stock data.
+    ticker (str): Stock ticker symbol, part of the cache key.
+    duration (str): Selected duration, part of the cache key.
+    length (int): Number of rows in _data, part of the cache key.
+    end_date (Timestamp): Last index entry of _data, part of the cache key.
+
     Returns:
     Chart: Altair chart object.
     """
-    min_value = data["Close"].min()
-    max_value = data["Close"].max()
+    import altair as alt
+
+    data = _data
+    min_value, max_value = _close_bounds(data, ticker, duration)
+    # Altair JSON-encodes every row into the vega spec, which dominates
+    # render time on long histories; downsample to ~1000 visually
+    # equivalent points with LTTB
+    if len(data) > 2000:
+        keep = _lttb(data.index.astype('int64').to_numpy().astype(np.float64),
+                     data["Close"].to_numpy(), 1000)
+        data = data.iloc[keep]
+
     y_min = min_value - (max_value - min_value) * 0.1
     y_max = max_value + (max_value - min_value) * 0.1
 
-    chart = alt.Chart(data.reset_index()).mark_line().encode(
+    # The chart only uses Date and Close; build a narrow two-column frame
+    # over NumPy views instead of materializing all columns via reset_index
+    chart_source = pd.DataFrame({"Date": data.index.values, "Close": data["Close"].to_numpy()})
+
+    chart = alt.Chart(chart_source).mark_line().encode(
         x=alt.X('Date:T', axis=alt.Axis(title='Date')),
         y=alt.Y('Close:Q', scale=alt.Scale(domain=[y_min, y_max]), axis=alt.Axis(title='Closing Price')),
         tooltip=['Date:T', 'Close:Q']
@@ -131,38 +407,33 @@ def display_analytics(filtered_data, duration):
         st.write("No data available for the selected duration.")
         return
 
-    # Retrieve the first and last entry in the filtered data to calculate changes
-    first_data = filtered_data.iloc[0]
-    last_data = filtered_data.iloc[-1]
-    
-    first_close = first_data["Close"]
-    last_close = last_data["Close"]
-    first_open = first_data["Open"]
-    last_open = last_data["Open"]
-    volume_traded = filtered_data["Volume"].sum()  # Total volume traded over the period
+    # Read the endpoints straight from a NumPy array: one contiguous pass
+    # instead of separate pandas indexer calls per value. The explicit
+    # dtype/na_value matter on the Arrow-backed frame — a plain to_numpy()
+    # yields object dtype where a null endpoint is pd.NA, whose truthiness
+    # raises, while NaN keeps the baseline comparison semantics
+    ohlc = filtered_data[["Open", "Close"]].to_numpy(dtype="float64", na_value=np.nan)
+    first_open, first_close = ohlc[0]
+    last_open, last_close = ohlc[-1]
+    volume_traded = filtered_data["Volume"].sum()  # Total volume traded over the period, skipping NA rows
     percent_change = ((last_close - first_close) / first_close) * 100 if first_close != 0 else 0
 
-    # Create a DataFrame for the analytics data
-    analytics_data = pd.DataFrame({
-        "Metric": ["Opening Price at start of period", "Closing Price at start of period",
-                   "Opening Price at end of period", "Closing Price at end of period",
-                   "Total Volume Traded", "Percentage Change over period"],
-        "Value": [f"{first_open:.2f}", f"{first_close:.2f}", f"{last_open:.2f}", f"{last_close:.2f}",
-                  f"{volume_traded:,}", f"{percent_change:.2f}%"]
-    })
-
-    # Display the analytics table with alternating background colors
-    #st.table(analytics_data.style.apply(lambda x: ['background-color: lightgray' if i % 2 == 0 else '' for i in range(len(x))], axis=1), index=False)
+    # Render the six-row analytics table as a plain HTML string; a pandas
+    # Styler would pull jinja2 templating into every rerun for the same markup
+    metrics = ["Opening Price at start of period", "Closing Price at start of period",
+               "Opening Price at end of period", "Closing Price at end of period",
+               "Total Volume Traded", "Percentage Change over period"]
+    values = [f"{first_open:.2f}", f"{first_close:.2f}", f"{last_open:.2f}", f"{last_close:.2f}",
+              f"{volume_traded:,}", f"{percent_change:.2f}%"]
+    rows = "".join(f"<tr><td>{metric}</td><td>{value}</td></tr>"
+                   for metric, value in zip(metrics, values))
     st.markdown(
         f"""
         <div style="display: flex; justify-content: center; margin-bottom: 40px;">
-            {analytics_data.style
-                .hide(axis="index")
-                .set_table_styles([
-                    {'selector': 'th', 'props': [('text-align', 'center')]},
-                    {'selector': 'td', 'props': [('text-align', 'center')]}
-                ])
-                .to_html()}
+            <table style="text-align: center;">
+                <thead><tr><th>Metric</th><th>Value</th></tr></thead>
+                <tbody>{rows}</tbody>
+            </table>
         </div>
         """,
         unsafe_allow_html=True
@@ -214,22 +485,48 @@ def main():
 
     st.markdown("<h1 style='text-align: center;'>Stock Data Collector</h1>", unsafe_allow_html=True)
 
-    ticker = st.text_input("Enter the Ticker symbol of the Company you want details for:")
+    ticker_input = st.text_input("Enter the Ticker symbol(s) of the Company you want details for (comma or space separated):")
     market = st.selectbox("Select the market:", list(MARKET_SUFFIXES.keys()))
 
-    if 'stock_data' not in st.session_state:
-        st.session_state.stock_data = None
+    if 'fetched' not in st.session_state:
+        st.session_state.fetched = None
+
+    fetch_clicked = st.button("Fetch Data")
+    if fetch_clicked:
+        tickers = tuple(t for t in ticker_input.replace(',', ' ').split() if t)
+        st.session_state.fetched = (tickers, market) if tickers else None
 
-    if st.button("Fetch Data"):
+    stock_data = None
+    ticker = None
+    if st.session_state.fetched is not None:
+        fetched_tickers, fetched_market = st.session_state.fetched
         try:
-            st.session_state.stock_data = get_stock_data(ticker, market)
-            save_data_to_json(st.session_state.stock_data, ticker)
+            if len(fetched_tickers) > 1:
+                batch = get_stock_data_batch(fetched_tickers, fetched_market)
+                ticker = st.selectbox("Select the ticker to display:", fetched_tickers)
+                stock_data = batch[ticker]
+            else:
+                ticker = fetched_tickers[0]
+                stock_data = get_stock_data(ticker, fetched_market)
         except InvalidInputError as e:
+            st.session_state.fetched = None
             st.error(str(e))
         except Exception as e:
+            st.session_state.fetched = None
             st.error(f"An unexpected error occurred: {str(e)}")
 
-    if st.session_state.stock_data is not None:
+    if stock_data is not None:
+        if fetch_clicked:
+            try:
+                save_data_to_parquet(stock_data, ticker)
+            except Exception as e:
+                st.error(f"An unexpected error occurred: {str(e)}")
+        if st.button("Export JSON"):
+            try:
+                save_data_to_json(stock_data, ticker)
+            except Exception as e:
+                st.error(f"An unexpected error occurred: {str(e)}")
+
         durations = list(DURATIONS_DAYS.keys())
         default_duration = "5D"
 
@@ -244,7 +541,7 @@ def main():
                 if st.button(duration, key=f"duration_button_{duration}"):
                     st.session_state.selected_duration = duration
 
-        filtered_data = filter_data_by_duration(st.session_state.stock_data, st.session_state.selected_duration)
+        filtered_data = filter_data_by_duration(stock_data, st.session_state.selected_duration)
 
         if not filtered_data.empty:
             with st.expander("Analytics"):
@@ -254,7 +551,8 @@ def main():
                 display_analytics(filtered_data, st.session_state.selected_duration)
 
             with st.expander("Chart", expanded=True):
-                chart = create_chart(filtered_data)
+                chart = create_chart(filtered_data, ticker, st.session_state.selected_duration,
+                                     len(filtered_data), filtered_data.index[-1])
                 st.altair_chart(chart, use_container_width=True)
         else:
             st.warning("No data available for the selected duration.")
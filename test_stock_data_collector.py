@@ -0,0 +1,31 @@
+import numpy as np
+import orjson
+import pandas as pd
+
+import stock_data_collector as sdc
+
+
+def _sample_frame():
+    index = pd.date_range("2024-01-01", periods=5, freq="D", name="Date")
+    return pd.DataFrame({
+        "Open": [1.1, 2.2, 3.3, 4.4, 5.5],
+        "High": [1.6, 2.7, 3.8, 4.9, 6.1],
+        "Low": [0.9, 1.8, 2.7, 3.6, 4.5],
+        "Close": [1.2, 2.3, 3.4, 4.5, 5.6],
+        "Adj Close": [1.2, 2.3, 3.4, 4.5, 5.6],
+        "Volume": [100, 200, 300, 400, 500],
+    }, index=index)
+
+
+def test_save_data_to_json_round_trips(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    data = sdc._compact_dtypes(_sample_frame())
+
+    sdc.save_data_to_json(data, "TEST")
+
+    payload = orjson.loads((tmp_path / "TEST_data.json").read_bytes())
+    restored = pd.DataFrame(payload["data"], columns=payload["columns"],
+                            index=pd.to_datetime(payload["index"]))
+    assert list(restored.columns) == list(data.columns)
+    assert restored.index.equals(data.index)
+    np.testing.assert_allclose(restored.to_numpy(), data.to_numpy(dtype="float64"))